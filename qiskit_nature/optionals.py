@@ -73,6 +73,12 @@ HAS_PYSCF = LazyImportTester(
     msg="See https://pyscf.org/install.html",
 )
 
+HAS_CUPY = LazyImportTester(
+    "cupy",
+    name="CuPy",
+    msg="See https://docs.cupy.dev/en/stable/install.html",
+)
+
 GAUSSIAN_16 = "g16"
 GAUSSIAN_16_DESC = "Gaussian 16"
 HAS_GAUSSIAN = NatureLazySubprocessTester(
@@ -14,8 +14,12 @@
 
 from __future__ import annotations
 
+import sys
+import weakref
+
 import numpy as np
 
+import qiskit_nature.optionals as _optionals
 from qiskit_nature.exceptions import QiskitNatureError
 from qiskit_nature.second_q.circuit.library import UCC
 from qiskit_nature.second_q.properties import (
@@ -29,46 +33,193 @@ from qiskit_nature.second_q.properties.integrals import ElectronicIntegrals
 
 from .initial_point import InitialPoint
 
+if sys.version_info >= (3, 8):
+    # pylint: disable=no-name-in-module
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+_PRECISION_DTYPES = {"fp32": np.float32, "fp64": np.float64}
+
+_BACKENDS = ("numpy", "cupy")
+
+# Two-body integrals which passed the restricted-spin validation, mapped to a fingerprint of their
+# alpha-alpha-spin matrix, such that repeated MP2 computations on them skip the comparison.
+_RESTRICTED_SPIN_INTEGRALS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _is_restricted_spin(
+    two_body_mo_integral: ElectronicIntegrals, integral_matrix: np.ndarray
+) -> bool:
+    """Check whether the alpha and beta spin two-body integrals are identical.
+
+    Args:
+        two_body_mo_integral: The two-body molecular orbitals integrals.
+        integral_matrix: The alpha-alpha-spin matrix of these integrals.
+
+    Returns:
+        Whether the alpha and beta spin orbitals are identical.
+    """
+    fingerprint = (integral_matrix.shape, integral_matrix.flat[:128].tobytes())
+    if _RESTRICTED_SPIN_INTEGRALS.get(two_body_mo_integral) == fingerprint:
+        return True
+
+    # When no beta-beta-spin matrix is stored, the integrals fall back to the alpha-alpha-spin
+    # matrix itself, in which case the (costly) element-wise comparison can be skipped.
+    beta_integral_matrix: np.ndarray = two_body_mo_integral.get_matrix(2)
+    if beta_integral_matrix is not integral_matrix and not np.allclose(
+        integral_matrix, beta_integral_matrix
+    ):
+        return False
+
+    _RESTRICTED_SPIN_INTEGRALS[two_body_mo_integral] = fingerprint
+    return True
+
+
+def _check_precision(precision: str) -> None:
+    """Check that the precision is supported.
+
+    Args:
+        precision: The floating-point precision to run the MP2 computation in.
+
+    Raises:
+        ValueError: If the precision is neither ``"fp32"`` nor ``"fp64"``.
+    """
+    if precision not in _PRECISION_DTYPES:
+        raise ValueError(
+            f"Unsupported precision '{precision}', expected one of {list(_PRECISION_DTYPES)}."
+        )
+
+
+def _check_backend(backend: str) -> None:
+    """Check that the backend is supported.
+
+    Args:
+        backend: The array library to run the MP2 computation with.
+
+    Raises:
+        ValueError: If the backend is neither ``"numpy"`` nor ``"cupy"``.
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unsupported backend '{backend}', expected one of {list(_BACKENDS)}.")
+
 
 def _compute_mp2(
-    num_occ: int, integral_matrix: np.ndarray, orbital_energies: np.ndarray
+    num_occ: int,
+    integral_matrix: np.ndarray,
+    orbital_energies: np.ndarray,
+    precision: Literal["fp32", "fp64"] = "fp32",
+    backend: Literal["numpy", "cupy"] = "numpy",
 ) -> tuple[np.ndarray, float]:
     """Compute the T2 amplitudes and MP2 energy correction.
 
+    The integrals are expected to be real, such that they are symmetric under the exchange of the
+    (occupied, virtual) pairs, i.e. ``integral_matrix[i, a, j, b] == integral_matrix[j, b, i, a]``.
+    This symmetry is exploited to only compute half of the amplitudes. Integrals violating it lead
+    to results which differ from the standard MP2 expressions.
+
     Args:
         num_occ: The number of occupied molecular orbitals.
-        integral_matrix: The two-body molecular orbitals matrix.
+        integral_matrix: The two-body molecular orbitals matrix, satisfying the symmetry above.
         orbital_energies: The orbital energies.
+        precision: The floating point precision of the intermediate computation. Single precision
+            is sufficient for an initial point and halves the memory footprint. The results are
+            always returned in double precision.
+        backend: The array library used for the computation. With ``"cupy"`` the computation
+            runs on a GPU via CuPy, which pays off for large numbers of orbitals. The results are
+            always returned as NumPy objects.
 
     Returns:
         A tuple consisting of the:
         - T amplitudes t2[i, j, a, b] (i, j in occupied, a, b in virtual).
         - The MP2 energy correction.
 
+    Raises:
+        ValueError: If the precision is neither ``"fp32"`` nor ``"fp64"``.
+        ValueError: If the backend is neither ``"numpy"`` nor ``"cupy"``.
+        MissingOptionalLibraryError: If the ``"cupy"`` backend is requested but CuPy is not
+            installed.
     """
-    # We use NumPy broadcasting to compute the matrix of occupied - virtual energy deltas with
-    # shape (num_occ, num_vir), such that
-    # energy_deltas[i, a] = orbital_energy[i] - orbital_energy[a].
+    _check_precision(precision)
+    dtype = _PRECISION_DTYPES[precision]
+
+    _check_backend(backend)
+    xnp = np
+    if backend == "cupy":
+        _optionals.HAS_CUPY.require_now("MP2 computation with the cupy backend")
+        # pylint: disable=import-error
+        import cupy as xnp
+
+    # Split the orbital energies into contiguous occupied and virtual parts.
     # NOTE In the unrestricted-spin calculation, the orbital energies will be a 2D array, and this
     # logic will need to be revisited.
-    energy_deltas = orbital_energies[:num_occ, np.newaxis] - orbital_energies[num_occ:]
+    occupied_energies = xnp.ascontiguousarray(xnp.asarray(orbital_energies[:num_occ], dtype=dtype))
+    virtual_energies = xnp.ascontiguousarray(xnp.asarray(orbital_energies[num_occ:], dtype=dtype))
 
-    # We now want to compute a 4D tensor of (occupied, occupied) - (virtual, virtual)
-    # energy deltas with shape (num_occ, num_vir, num_occ, num_vir), such that
-    # double_deltas[i, a, j, b] = orbital_energies[i] + orbital_energies[j]
-    #                             - orbital_energies[a] - orbital_energies[b].
-    # Again we can use NumPy broadcasting to speed this up.
-    double_deltas = energy_deltas[:, :, np.newaxis, np.newaxis] + energy_deltas
+    # We use NumPy broadcasting to compute the matrix of occupied - virtual energy deltas with
+    # shape (num_occ, num_vir), such that
+    # energy_deltas[i, a] = orbital_energy[i] - orbital_energy[a].
+    energy_deltas = occupied_energies[:, xnp.newaxis] - virtual_energies
 
     # Create integral matrix that uses occupied and virtual indices rather than MO indices.
-    integral_matrix_ovov = integral_matrix[:num_occ, num_occ:, :num_occ, num_occ:]
+    # We store it contiguously in the (num_occ, num_occ, num_vir, num_vir) order of the T2
+    # amplitudes, such that integral_matrix_oovv[i, j, a, b] = integral_matrix[i, a, j, b] and all
+    # of the following operations walk both tensors with matching, contiguous strides.
+    integral_matrix_oovv = xnp.ascontiguousarray(
+        xnp.asarray(integral_matrix[:num_occ, num_occ:, :num_occ, num_occ:]).transpose(0, 2, 1, 3),
+        dtype=dtype,
+    )
+
+    # We compute the T2 amplitudes and the MP2 energy correction in a single pass over the first
+    # occupied index. Each iteration handles a (num_occ, num_vir, num_vir) slab, such that the
+    # amplitudes are contracted into the energy while they are still in cache.
+    # The amplitudes obey t2[i, j, a, b] = t2[j, i, b, a], because the integrals and the energy
+    # deltas are symmetric under the exchange of the (i, a) and (j, b) pairs. Thus, we only compute
+    # the amplitudes for j >= i and mirror them into the remaining part of the tensor.
+    t2_amplitudes = xnp.empty_like(integral_matrix_oovv)
+    antisymmetrized_buffer = xnp.empty(integral_matrix_oovv.shape[1:], dtype=dtype)
+    energy_correction = 0.0
+    for i in range(num_occ):
+        integrals = integral_matrix_oovv[i, i:]
+        exchange_integrals = integrals.transpose(0, 2, 1)
+
+        # The (occupied, occupied) - (virtual, virtual) energy deltas of this slab, such that
+        # double_deltas[j, a, b] = orbital_energies[i] + orbital_energies[j]
+        #                          - orbital_energies[a] - orbital_energies[b].
+        # These are broadcast directly into the amplitudes slab, which is then inverted and
+        # multiplied in-place, such that no separate tensor of energy deltas is ever allocated and
+        # the integrals are scaled by a multiplication rather than the slower division.
+        double_deltas = xnp.add(
+            energy_deltas[i, xnp.newaxis, :, xnp.newaxis],
+            energy_deltas[i:, xnp.newaxis, :],
+            out=t2_amplitudes[i, i:],
+        )
+        inverse_deltas = xnp.reciprocal(double_deltas, out=double_deltas)
+        amplitudes = xnp.multiply(integrals, inverse_deltas, out=inverse_deltas)
+        t2_amplitudes[i + 1 :, i] = amplitudes[1:].transpose(0, 2, 1)
+
+        # Accumulate the contractions of the amplitudes with the direct and the exchange integrals
+        # of this slab. Both are combined into a single reduction against the antisymmetrized
+        # integrals, i.e. twice the direct integrals minus the exchange integrals.
+        # The pairs with j > i contribute the same energy as their mirrored counterparts, so they
+        # count twice.
+        antisymmetrized_integrals = xnp.multiply(
+            integrals, 2, out=antisymmetrized_buffer[: num_occ - i]
+        )
+        antisymmetrized_integrals -= exchange_integrals
+        antisymmetrized_integrals[1:] *= 2
+        energy_correction += float(xnp.vdot(amplitudes, antisymmetrized_integrals))
 
-    # Compute T2 amplitudes and transpose to num_occ, num_occ, num_vir, num_vir.
-    t2_amplitudes = (integral_matrix_ovov / double_deltas).transpose(0, 2, 1, 3)
+        # Drop the views of this slab, such that they do not keep the integrals alive below.
+        del integrals, exchange_integrals, antisymmetrized_integrals
 
-    # Compute MP2 energy correction.
-    energy_correction = np.einsum("ijab,iajb", t2_amplitudes, integral_matrix_ovov) * 2
-    energy_correction -= np.einsum("ijab,ibja", t2_amplitudes, integral_matrix_ovov)
+    # Release the integrals before the amplitudes are cast to double precision, which allocates
+    # another tensor of the same shape in single precision.
+    del integral_matrix_oovv, antisymmetrized_buffer
+
+    t2_amplitudes = t2_amplitudes.astype(np.float64, copy=False)
+    if xnp is not np:
+        t2_amplitudes = xnp.asnumpy(t2_amplitudes)
 
     return t2_amplitudes, energy_correction
 
@@ -94,8 +245,9 @@ class MP2InitialPoint(InitialPoint):
     the setter will obtain the Hartree-Fock ``reference_energy`` to compute the
     :attr:`total_energy`.
 
-    Setting the :attr:`grouped_property` will compute the :attr:`t2_amplitudes` and
-    :attr:`energy_correction`.
+    The :attr:`t2_amplitudes` and :attr:`energy_correction` are computed from the
+    :attr:`grouped_property` when they are first needed. In particular, they are never computed for
+    an :attr:`excitation_list` without any double excitations, e.g. for a UCCS ansatz.
 
     Following computation, one can obtain the initial point array via the :meth:`to_numpy_array`
     method. The initial point parameters that correspond to double excitations in the
@@ -103,11 +255,45 @@ class MP2InitialPoint(InitialPoint):
     :attr:`threshold` or that correspond to single, triple, or higher excitations will be zero.
     """
 
-    def __init__(self, threshold: float = 1e-12) -> None:
+    def __init__(
+        self,
+        threshold: float = 1e-12,
+        precision: Literal["fp32", "fp64"] = "fp32",
+        backend: Literal["numpy", "cupy"] = "numpy",
+    ) -> None:
+        """
+        Args:
+            threshold: Amplitudes below this vanish in the initial point array.
+            precision: The floating point precision of the MP2 computation, either ``"fp32"`` or
+                ``"fp64"``. Single precision is sufficient for an initial point, but the
+                :attr:`energy_correction` and :attr:`total_energy` are then only accurate to
+                about seven significant digits. Use ``"fp64"`` for full double precision.
+            backend: The array library used for the MP2 computation, either ``"numpy"`` or
+                ``"cupy"``. The latter runs the computation on a GPU, which pays off for large
+                numbers of orbitals, and requires CuPy to be installed.
+
+        Raises:
+            ValueError: If the precision is neither ``"fp32"`` nor ``"fp64"``.
+            ValueError: If the backend is neither ``"numpy"`` nor ``"cupy"``.
+            MissingOptionalLibraryError: If the ``"cupy"`` backend is requested but CuPy is not
+                installed.
+        """
         super().__init__()
+        _check_precision(precision)
+        self._precision = precision
+        _check_backend(backend)
+        if backend == "cupy":
+            _optionals.HAS_CUPY.require_now("MP2InitialPoint with the cupy backend")
+        self._backend = backend
         self.threshold: float = threshold
         self._ansatz: UCC | None = None
         self._excitation_list: list[tuple[tuple[int, ...], tuple[int, ...]]] | None = None
+        self._doubles_occ: np.ndarray = np.empty((0, 2), dtype=np.int32)
+        self._doubles_vir: np.ndarray = np.empty((0, 2), dtype=np.int32)
+        self._doubles_positions: np.ndarray = np.empty(0, dtype=np.intp)
+        self._doubles_cache: tuple[tuple[int, ...], np.ndarray] | None = None
+        self._mp2_inputs: tuple[int, np.ndarray, np.ndarray, str, str] | None = None
+        self._reference_energy: float = 0.0
         self._t2_amplitudes: np.ndarray | None = None
         self._parameters: np.ndarray | None = None
         self._energy_correction: float = 0.0
@@ -128,9 +314,7 @@ class MP2InitialPoint(InitialPoint):
         # Operators must be built early to compute the excitation list.
         _ = ansatz.operators
 
-        self._invalidate()
-
-        self._excitation_list = ansatz.excitation_list
+        self.excitation_list = ansatz.excitation_list
         self._ansatz = ansatz
 
     @property
@@ -143,7 +327,23 @@ class MP2InitialPoint(InitialPoint):
 
     @excitation_list.setter
     def excitation_list(self, excitations: list[tuple[tuple[int, ...], tuple[int, ...]]]):
-        self._invalidate()
+        self._invalidate_excitations()
+
+        # Store the occupied and virtual spin-orbital indices of the double excitations together
+        # with their positions in the excitation list as integer arrays, such that the excitations
+        # need not be walked again in Python when computing the initial point.
+        doubles = [
+            (index, excitation)
+            for index, excitation in enumerate(excitations or [])
+            if len(excitation[0]) == 2
+        ]
+        self._doubles_occ = np.asarray(
+            [excitation[0] for _, excitation in doubles], dtype=np.int32
+        ).reshape(-1, 2)
+        self._doubles_vir = np.asarray(
+            [excitation[1] for _, excitation in doubles], dtype=np.int32
+        ).reshape(-1, 2)
+        self._doubles_positions = np.asarray([index for index, _ in doubles], dtype=np.intp)
 
         self._excitation_list = excitations
 
@@ -192,7 +392,7 @@ class MP2InitialPoint(InitialPoint):
             )
 
         integral_matrix: np.ndarray = two_body_mo_integral.get_matrix()
-        if not np.allclose(integral_matrix, two_body_mo_integral.get_matrix(2)):
+        if not _is_restricted_spin(two_body_mo_integral, integral_matrix):
             raise NotImplementedError(
                 "`MP2InitialPoint` only supports restricted-spin setups. "
                 "Alpha and beta spin orbitals must be identical. "
@@ -213,13 +413,17 @@ class MP2InitialPoint(InitialPoint):
 
         self._invalidate()
 
-        t2_amplitudes, energy_correction = _compute_mp2(num_occ, integral_matrix, orbital_energies)
-
-        # Save state.
+        # Save state. The MP2 computation itself is deferred until its results are needed.
         self._grouped_property = grouped_property
-        self._t2_amplitudes = t2_amplitudes
-        self._energy_correction = energy_correction
-        self._total_energy = reference_energy + energy_correction
+        self._mp2_inputs = (
+            num_occ,
+            integral_matrix,
+            orbital_energies,
+            self._precision,
+            self._backend,
+        )
+        self._reference_energy = reference_energy
+        self._t2_amplitudes = None
 
     @property
     def t2_amplitudes(self) -> np.ndarray:
@@ -228,11 +432,13 @@ class MP2InitialPoint(InitialPoint):
         Given ``t2[i, j, a, b]`` ``i, j`` carry virtual indices, while ``a, b`` carry occupied
         indices.
         """
+        self._compute_corrections()
         return self._t2_amplitudes
 
     @property
     def energy_correction(self) -> float:
         """The MP2 energy correction."""
+        self._compute_corrections()
         return self._energy_correction
 
     @property
@@ -243,8 +449,19 @@ class MP2InitialPoint(InitialPoint):
         :class:`~qiskit_nature.second_q.properties.ElectronicEnergy` this will be equal to
         :attr:`energy_correction`.
         """
+        self._compute_corrections()
         return self._total_energy
 
+    @property
+    def precision(self) -> str:
+        """The floating point precision of the MP2 computation."""
+        return self._precision
+
+    @property
+    def backend(self) -> str:
+        """The array library used for the MP2 computation."""
+        return self._backend
+
     @property
     def threshold(self) -> float:
         """Amplitudes below this vanish in the initial point array."""
@@ -304,23 +521,71 @@ class MP2InitialPoint(InitialPoint):
         Returns:
             The MP2 T2 amplitudes for each excitation.
         """
-        num_occ = self._t2_amplitudes.shape[0]
         amplitudes = np.zeros(len(self.excitation_list))
-        for index, excitation in enumerate(self._excitation_list):
-            if len(excitation[0]) == 2:
-                # Get the amplitude of the double excitation.
-                [[i, j], [a, b]] = np.asarray(excitation) % num_occ
-                amplitude = self._t2_amplitudes[i, j, a - num_occ, b - num_occ]
-                amplitudes[index] = amplitude if abs(amplitude) > self._threshold else 0.0
+
+        # Without any double excitations there is no need for the MP2 computation at all.
+        if self._doubles_positions.size == 0:
+            self._parameters = amplitudes
+            return
+
+        self._compute_corrections()
+
+        # Gather the amplitudes of all double excitations at once from the flattened (contiguous)
+        # T2 amplitudes.
+        indices = self._get_doubles_indices(self._t2_amplitudes.shape)
+        doubles_amplitudes = self._t2_amplitudes.ravel().take(indices)
+        amplitudes[self._doubles_positions] = np.where(
+            np.abs(doubles_amplitudes) > self._threshold, doubles_amplitudes, 0.0
+        )
 
         self._parameters = amplitudes
 
+    def _compute_corrections(self) -> None:
+        """Compute the T2 amplitudes and MP2 energy correction, unless they are up to date."""
+        if self._t2_amplitudes is not None or self._mp2_inputs is None:
+            return
+
+        t2_amplitudes, energy_correction = _compute_mp2(*self._mp2_inputs)
+
+        # The inputs are no longer needed, so drop the reference to the integral matrix.
+        self._mp2_inputs = None
+        self._t2_amplitudes = t2_amplitudes
+        self._energy_correction = energy_correction
+        self._total_energy = self._reference_energy + energy_correction
+
     def to_numpy_array(self) -> np.ndarray:
         """The initial point as a NumPy array."""
         if self._parameters is None:
             self.compute()
         return self._parameters
 
+    def _get_doubles_indices(self, shape: tuple[int, ...]) -> np.ndarray:
+        """Get the indices of the double excitations into the flattened T2 amplitudes.
+
+        These only depend on the excitation list and the shape of the T2 amplitudes, so they are
+        cached across repeated computations, e.g. following a change of :attr:`threshold`.
+
+        Args:
+            shape: The shape (num_occ, num_occ, num_vir, num_vir) of the T2 amplitudes.
+
+        Returns:
+            The index into the flattened T2 amplitudes of each double excitation.
+        """
+        if self._doubles_cache is None or self._doubles_cache[0] != shape:
+            num_occ, _, num_vir, _ = shape
+            ijab = np.hstack((self._doubles_occ, self._doubles_vir)) % num_occ
+            # Shifting the virtual indices by num_vir reproduces the negative a - num_occ index
+            # used by the old per-excitation loop, which counts from the end of the virtual axis.
+            ijab[:, 2:] += num_vir - num_occ
+            self._doubles_cache = (shape, np.ravel_multi_index(ijab.T, shape))
+
+        return self._doubles_cache[1]
+
     def _invalidate(self):
         """Invalidate any previous computation."""
         self._parameters = None
+
+    def _invalidate_excitations(self):
+        """Invalidate any previous computation, including the parsed excitation list."""
+        self._invalidate()
+        self._doubles_cache = None
@@ -15,16 +15,19 @@
 from __future__ import annotations
 
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from test import QiskitNatureTestCase
 
 import numpy as np
 from ddt import ddt, data
 
+from qiskit.exceptions import MissingOptionalLibraryError
+
 from qiskit_nature import optionals
 from qiskit_nature.exceptions import QiskitNatureError
 from qiskit_nature.second_q.circuit.library import HartreeFock, UCC
+from qiskit_nature.second_q.circuit.library.ansatzes.utils import generate_fermionic_excitations
 from qiskit_nature.second_q.drivers import PySCFDriver
 from qiskit_nature.second_q.problems import ElectronicStructureProblem
 from qiskit_nature.second_q.properties import (
@@ -36,6 +39,7 @@ from qiskit_nature.second_q.properties import (
 from qiskit_nature.second_q.properties.integrals import ElectronicIntegrals
 from qiskit_nature.second_q.mappers import QubitConverter, JordanWignerMapper
 from qiskit_nature.second_q.algorithms.initial_points import MP2InitialPoint
+from qiskit_nature.second_q.algorithms.initial_points.mp2_initial_point import _compute_mp2
 
 
 @ddt
@@ -140,6 +144,22 @@ class TestMP2InitialPoint(QiskitNatureTestCase):
         mp2_initial_point = MP2InitialPoint(threshold=-3.0)
         self.assertEqual(mp2_initial_point.threshold, 3.0)
 
+    def test_precision(self):
+        """Test the precision of the MP2 computation."""
+
+        with self.subTest("Test single precision is the default."):
+            self.assertEqual(MP2InitialPoint().precision, "fp32")
+        with self.subTest("Test double precision energy correction."):
+            self.electronic_energy.orbital_energies = np.array([-1.0, 1.0])
+            self.electronic_integrals.get_matrix = Mock(return_value=np.full((2, 2, 2, 2), 0.1))
+            mp2_initial_point = MP2InitialPoint(precision="fp64")
+            mp2_initial_point.grouped_property = self.mock_grouped_property
+            self.assertEqual(mp2_initial_point.precision, "fp64")
+            self.assertAlmostEqual(mp2_initial_point.energy_correction, -0.0025, places=15)
+        with self.subTest("Test unsupported precision raises."):
+            with self.assertRaises(ValueError):
+                MP2InitialPoint(precision="fp16")
+
     def test_no_grouped_property_and_no_ansatz(self):
         """Test when no grouped property and no ansatz are provided."""
 
@@ -277,6 +297,207 @@ class TestMP2InitialPoint(QiskitNatureTestCase):
         with self.assertRaises(NotImplementedError):
             mp2_initial_point.compute(ansatz=self.mock_ansatz, grouped_property=grouped_property)
 
+    def test_restricted_spins_skip_comparison(self):
+        """Test that identical alpha and beta spin matrices are not compared element-wise."""
+
+        mp2_initial_point = MP2InitialPoint()
+        with patch("numpy.allclose") as mock_allclose:
+            mp2_initial_point.grouped_property = self.mock_grouped_property
+        mock_allclose.assert_not_called()
+        self.assertEqual(mp2_initial_point.energy_correction, 0.0)
+
+    def test_restricted_spin_validation_cached(self):
+        """Test that the restricted-spin validation is not repeated for the same integrals."""
+
+        beta_matrix = np.zeros((1, 1, 1, 1))
+        self.electronic_integrals.get_matrix = Mock(
+            side_effect=lambda index=0: beta_matrix if index == 2 else np.zeros((1, 1, 1, 1))
+        )
+
+        MP2InitialPoint().grouped_property = self.mock_grouped_property
+        mp2_initial_point = MP2InitialPoint()
+        with patch("numpy.allclose") as mock_allclose:
+            mp2_initial_point.grouped_property = self.mock_grouped_property
+        mock_allclose.assert_not_called()
+
+    def test_no_double_excitations_skip_mp2(self):
+        """Test that MP2 is only computed on demand when there are no double excitations."""
+
+        mp2_module = "qiskit_nature.second_q.algorithms.initial_points.mp2_initial_point"
+        mp2_initial_point = MP2InitialPoint()
+        with patch(f"{mp2_module}._compute_mp2", wraps=_compute_mp2) as mock_compute_mp2:
+            mp2_initial_point.compute(
+                ansatz=self.mock_ansatz, grouped_property=self.mock_grouped_property
+            )
+            with self.subTest("Test initial point is computed without MP2."):
+                np.testing.assert_array_equal(mp2_initial_point.to_numpy_array(), [0.0])
+                mock_compute_mp2.assert_not_called()
+            with self.subTest("Test energy correction is computed on demand."):
+                self.assertEqual(mp2_initial_point.energy_correction, 0.0)
+                mock_compute_mp2.assert_called_once()
+            with self.subTest("Test MP2 inputs are released after the computation."):
+                self.assertIsNone(mp2_initial_point._mp2_inputs)
+                self.assertEqual(mp2_initial_point.total_energy, 123.45)
+                mock_compute_mp2.assert_called_once()
+
+    def test_excitations_cached_across_threshold_changes(self):
+        """Test that the parsed excitations survive a threshold change but not a new list."""
+
+        self.electronic_energy.orbital_energies = np.array([-1.0, 1.0])
+        self.electronic_integrals.get_matrix = Mock(return_value=np.ones((2, 2, 2, 2)))
+
+        mp2_initial_point = MP2InitialPoint()
+        mp2_initial_point.excitation_list = [((0,), (1,)), ((0, 2), (1, 3))]
+        mp2_initial_point.compute(grouped_property=self.mock_grouped_property)
+        doubles_cache = mp2_initial_point._doubles_cache
+
+        with self.subTest("Test double excitation amplitude is looked up."):
+            np.testing.assert_array_equal(mp2_initial_point.to_numpy_array(), [0.0, -0.25])
+
+        with self.subTest("Test cache is kept when the threshold changes."):
+            mp2_initial_point.threshold = 0.5
+            np.testing.assert_array_equal(mp2_initial_point.to_numpy_array(), [0.0, 0.0])
+            self.assertIsNotNone(doubles_cache)
+            self.assertIs(mp2_initial_point._doubles_cache, doubles_cache)
+
+        with self.subTest("Test cache is cleared when the excitation list changes."):
+            mp2_initial_point.excitation_list = [((0,), (1,))]
+            self.assertIsNone(mp2_initial_point._doubles_cache)
+
+    def test_doubles_lookup_matches_excitation_loop(self):
+        """Test the vectorized doubles lookup against the per-excitation amplitude loop."""
+
+        num_occ = 3
+        rng = np.random.default_rng(11)
+        integral_matrix = rng.random((7, 7, 7, 7))
+        integral_matrix += integral_matrix.transpose(1, 0, 2, 3)
+        integral_matrix += integral_matrix.transpose(0, 1, 3, 2)
+        integral_matrix += integral_matrix.transpose(2, 3, 0, 1)
+        orbital_energies = np.array([-2.0, -1.2, -0.7, 0.3, 0.8, 1.1, 2.5])
+        self.particle_number.num_particles = (num_occ, num_occ)
+        self.electronic_energy.orbital_energies = orbital_energies
+        self.electronic_integrals.get_matrix = Mock(return_value=integral_matrix)
+
+        excitation_list = generate_fermionic_excitations(1, 14, (num_occ, num_occ))
+        excitation_list += generate_fermionic_excitations(2, 14, (num_occ, num_occ))
+        t2_amplitudes, _ = _compute_mp2(num_occ, integral_matrix, orbital_energies)
+        threshold = float(np.median(np.abs(t2_amplitudes)))
+
+        expected = np.zeros(len(excitation_list))
+        for index, excitation in enumerate(excitation_list):
+            if len(excitation[0]) == 2:
+                [[i, j], [a, b]] = np.asarray(excitation) % num_occ
+                amplitude = t2_amplitudes[i, j, a - num_occ, b - num_occ]
+                expected[index] = amplitude if abs(amplitude) > threshold else 0.0
+
+        mp2_initial_point = MP2InitialPoint(threshold=threshold)
+        mp2_initial_point.excitation_list = excitation_list
+        mp2_initial_point.compute(grouped_property=self.mock_grouped_property)
+
+        with self.subTest("Test some amplitudes are masked by the threshold."):
+            num_doubles = sum(len(excitation[0]) == 2 for excitation in excitation_list)
+            self.assertTrue(0 < np.count_nonzero(expected) < num_doubles)
+        with self.subTest("Test amplitudes match the per-excitation loop."):
+            np.testing.assert_array_equal(mp2_initial_point.to_numpy_array(), expected)
+
+    def test_compute_mp2_reference(self):
+        """Test _compute_mp2 against the standard MP2 expressions."""
+
+        num_occ = 2
+        rng = np.random.default_rng(7)
+        integral_matrix = rng.random((6, 6, 6, 6))
+        integral_matrix += integral_matrix.transpose(1, 0, 2, 3)
+        integral_matrix += integral_matrix.transpose(0, 1, 3, 2)
+        integral_matrix += integral_matrix.transpose(2, 3, 0, 1)
+        orbital_energies = np.array([-2.0, -1.2, 0.3, 0.8, 1.1, 2.5])
+
+        energy_deltas = orbital_energies[:num_occ, np.newaxis] - orbital_energies[num_occ:]
+        double_deltas = energy_deltas[:, :, np.newaxis, np.newaxis] + energy_deltas
+        integral_matrix_ovov = integral_matrix[:num_occ, num_occ:, :num_occ, num_occ:]
+        expected_t2 = (integral_matrix_ovov / double_deltas).transpose(0, 2, 1, 3)
+        expected_energy = 2 * np.einsum("ijab,iajb", expected_t2, integral_matrix_ovov)
+        expected_energy -= np.einsum("ijab,ibja", expected_t2, integral_matrix_ovov)
+
+        t2_amplitudes, energy_correction = _compute_mp2(
+            num_occ, integral_matrix, orbital_energies, "fp64"
+        )
+
+        with self.subTest("Test T2 amplitudes."):
+            np.testing.assert_allclose(t2_amplitudes, expected_t2, rtol=1e-12)
+        with self.subTest("Test energy correction."):
+            np.testing.assert_allclose(energy_correction, expected_energy, rtol=1e-12)
+
+    def test_compute_mp2_precision(self):
+        """Test that single and double precision MP2 computations agree."""
+
+        rng = np.random.default_rng(42)
+        integral_matrix = rng.random((4, 4, 4, 4))
+        integral_matrix += integral_matrix.transpose(1, 0, 2, 3)
+        integral_matrix += integral_matrix.transpose(0, 1, 3, 2)
+        integral_matrix += integral_matrix.transpose(2, 3, 0, 1)
+        orbital_energies = np.array([-1.5, -0.5, 0.5, 1.5])
+
+        t2_fp32, energy_fp32 = _compute_mp2(2, integral_matrix, orbital_energies, "fp32")
+        t2_fp64, energy_fp64 = _compute_mp2(2, integral_matrix, orbital_energies, "fp64")
+
+        with self.subTest("Test results are returned in double precision."):
+            self.assertEqual(t2_fp32.dtype, np.float64)
+        with self.subTest("Test T2 amplitudes are contiguous."):
+            self.assertTrue(t2_fp32.flags.c_contiguous)
+            self.assertTrue(t2_fp64.flags.c_contiguous)
+        with self.subTest("Test T2 amplitudes agree."):
+            np.testing.assert_allclose(t2_fp32, t2_fp64, rtol=1e-5)
+        with self.subTest("Test energy corrections agree."):
+            np.testing.assert_allclose(energy_fp32, energy_fp64, rtol=1e-5)
+        with self.subTest("Test unsupported precision raises."):
+            with self.assertRaises(ValueError):
+                _compute_mp2(2, integral_matrix, orbital_energies, "fp16")
+
+    @unittest.skipIf(not optionals.HAS_CUPY, "cupy not available.")
+    def test_compute_mp2_cupy_backend(self):
+        """Test that the CuPy backend matches NumPy."""
+
+        rng = np.random.default_rng(42)
+        integral_matrix = rng.random((4, 4, 4, 4))
+        orbital_energies = np.array([-1.5, -0.5, 0.5, 1.5])
+
+        t2_numpy, energy_numpy = _compute_mp2(2, integral_matrix, orbital_energies, backend="numpy")
+        t2_cupy, energy_cupy = _compute_mp2(2, integral_matrix, orbital_energies, backend="cupy")
+
+        with self.subTest("Test results are NumPy objects."):
+            self.assertIsInstance(t2_cupy, np.ndarray)
+            self.assertIsInstance(energy_cupy, float)
+        with self.subTest("Test results agree."):
+            np.testing.assert_allclose(t2_cupy, t2_numpy, rtol=1e-5)
+            np.testing.assert_allclose(energy_cupy, energy_numpy, rtol=1e-5)
+
+    @unittest.skipIf(optionals.HAS_CUPY, "cupy is available.")
+    def test_cupy_backend_without_cupy(self):
+        """Test that requesting the CuPy backend without CuPy raises."""
+
+        with self.subTest("Test MP2InitialPoint raises."):
+            with self.assertRaises(MissingOptionalLibraryError):
+                MP2InitialPoint(backend="cupy")
+        with self.subTest("Test _compute_mp2 raises."):
+            with self.assertRaises(MissingOptionalLibraryError):
+                _compute_mp2(1, np.zeros((2, 2, 2, 2)), np.zeros(2), backend="cupy")
+
+    def test_backend(self):
+        """Test that the backend is validated and passed on to the MP2 computation."""
+
+        with self.subTest("Test unsupported backend raises."):
+            with self.assertRaises(ValueError):
+                MP2InitialPoint(backend="torch")
+            with self.assertRaises(ValueError):
+                _compute_mp2(1, np.zeros((2, 2, 2, 2)), np.zeros(2), backend="torch")
+        with self.subTest("Test backend is passed on."):
+            mp2_module = "qiskit_nature.second_q.algorithms.initial_points.mp2_initial_point"
+            mp2_initial_point = MP2InitialPoint(backend="numpy")
+            mp2_initial_point.grouped_property = self.mock_grouped_property
+            with patch(f"{mp2_module}._compute_mp2", wraps=_compute_mp2) as mock_compute_mp2:
+                _ = mp2_initial_point.energy_correction
+            self.assertEqual(mock_compute_mp2.call_args[0][4], "numpy")
+
 
 if __name__ == "__main__":
     unittest.main()